@@ -0,0 +1,161 @@
+import logging
+import os
+import time
+from collections import Counter
+from playwright.async_api import Browser, BrowserContext, Error, Page, Request, Route
+
+LEAN_MODE = os.getenv("SCRAPER_LEAN_MODE", "0") == "1"
+RECYCLE_AFTER_PAGES = int(os.getenv("SCRAPER_RECYCLE_AFTER_PAGES", "250"))
+RECYCLE_ABOVE_PSS_MB = int(os.getenv("SCRAPER_RECYCLE_ABOVE_PSS_MB", "1024"))
+MIN_PAGES_BETWEEN_RECYCLES = 20
+# Only the anchor lists in the raw HTML are read, so lean mode never fetches these.
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet", "script"})
+
+
+def chromium_pss_mb(proc_dir: str = "/proc", root_pid: int | None = None) -> float | None:
+    # Chromium runs below the Playwright driver, so this process and the driver itself are skipped.
+    # PSS splits memory shared between Chromium processes rather than counting it once per process.
+    root_pid = os.getpid() if root_pid is None else root_pid
+    try:
+        parents = {}
+        for pid in filter(str.isdigit, os.listdir(proc_dir)):
+            try:
+                with open(f"{proc_dir}/{pid}/stat") as stat:
+                    # The command name may contain spaces, so split after its closing parenthesis.
+                    parents[int(pid)] = int(stat.read().rsplit(")", 1)[1].split()[1])
+            except (OSError, IndexError, ValueError):
+                continue
+    except OSError:
+        return None
+
+    drivers = {pid for pid, ppid in parents.items() if ppid == root_pid}
+    tree, frontier = set(), {pid for pid, ppid in parents.items() if ppid in drivers}
+    while frontier:
+        tree |= frontier
+        frontier = {pid for pid, ppid in parents.items() if ppid in frontier} - tree
+
+    pss_kb = 0
+    for pid in tree:
+        try:
+            with open(f"{proc_dir}/{pid}/smaps_rollup") as smaps:
+                pss_kb += next(int(line.split()[1]) for line in smaps if line.startswith("Pss:"))
+        except (OSError, StopIteration, IndexError, ValueError):
+            continue
+    return pss_kb / 1024
+
+
+class PageStats:
+    def __init__(self, target_href: str):
+        self.target_href = target_href
+        self.bytes_received = 0
+        self.blocked: Counter[str] = Counter()
+        self.load_seconds = 0.0
+        self.requests_pending = 0
+        self.released = False
+        self.reported = False
+
+
+class WorkerPage:
+    def __init__(self, browser: Browser):
+        self.browser = browser
+        self.context: BrowserContext | None = None
+        self.page: Page | None = None
+        self.pages_visited = 0
+        self.stats = PageStats("")
+        self.request_stats: dict[Request, PageStats] = {}
+        self.bytes_received = 0
+        self.requests_blocked = 0
+        self.load_seconds = 0.0
+
+    async def acquire(self, target_href: str) -> None:
+        if self.page is None:
+            self.context = await self.browser.new_context()
+            if LEAN_MODE:
+                await self.context.route("**/*", self._route)
+            self.context.on("request", self._request_started)
+            self.context.on("requestfinished", self._request_finished)
+            self.context.on("requestfailed", self._request_failed)
+            self.page = await self.context.new_page()
+        self.stats = PageStats(target_href)
+
+    async def goto(self, href: str) -> Page:
+        started = time.perf_counter()
+        await self.page.goto(href, wait_until="domcontentloaded" if LEAN_MODE else "load")
+        self.stats.load_seconds += time.perf_counter() - started
+        return self.page
+
+    async def release(self) -> None:
+        self.stats.released = True
+        self._report(self.stats)
+        self.pages_visited += 1
+
+        if not LEAN_MODE:
+            return
+        if (reason := self.recycle_reason()) is not None:
+            logging.info(f"Recycling browser context {reason}")
+            await self.close()
+            if (pss_mb := chromium_pss_mb()) is not None and pss_mb > RECYCLE_ABOVE_PSS_MB:
+                logging.warning(f"Chromium PSS still at {pss_mb:.0f} MiB after recycling the browser context")
+
+    def recycle_reason(self) -> str | None:
+        if self.pages_visited >= RECYCLE_AFTER_PAGES:
+            return f"after {self.pages_visited} pages"
+        if self.pages_visited < MIN_PAGES_BETWEEN_RECYCLES:
+            return None
+        if (pss_mb := chromium_pss_mb()) is not None and pss_mb > RECYCLE_ABOVE_PSS_MB:
+            return f"at {pss_mb:.0f} MiB Chromium PSS"
+        return None
+
+    async def close(self) -> None:
+        if self.context is not None:
+            await self.context.close()
+        # Whatever was still in flight is cut off with the context, so report what has arrived.
+        for stats in {*self.request_stats.values(), self.stats}:
+            stats.requests_pending = 0
+            self._report(stats)
+        self.context, self.page, self.pages_visited = None, None, 0
+        self.request_stats.clear()
+
+    def _report(self, stats: PageStats) -> None:
+        if stats.reported or not stats.released or stats.requests_pending > 0:
+            return
+        stats.reported = True
+        self.bytes_received += stats.bytes_received
+        self.requests_blocked += stats.blocked.total()
+        self.load_seconds += stats.load_seconds
+        blocked = ", ".join(f"{count} {resource_type}" for resource_type, count in sorted(stats.blocked.items()))
+        logging.info(
+            f"Page {stats.target_href}: loaded in {stats.load_seconds:.2f}s, "
+            f"{stats.bytes_received / 1024:.1f} KiB received, blocked: {blocked or 'nothing'}"
+        )
+
+    async def _route(self, route: Route) -> None:
+        request = route.request
+        if request.resource_type in BLOCKED_RESOURCE_TYPES:
+            self.request_stats.get(request, self.stats).blocked[request.resource_type] += 1
+            await route.abort()
+        else:
+            await route.continue_()
+
+    def _request_started(self, request: Request) -> None:
+        self.request_stats[request] = self.stats
+        self.stats.requests_pending += 1
+
+    async def _request_finished(self, request: Request) -> None:
+        if (stats := self.request_stats.get(request)) is None:
+            return
+        try:
+            sizes = await request.sizes()
+            stats.bytes_received += sizes["responseHeadersSize"] + sizes["responseBodySize"]
+        except Error:  # The context was recycled before the sizes arrived.
+            pass
+        self._request_settled(request)
+
+    def _request_failed(self, request: Request) -> None:
+        self._request_settled(request)
+
+    def _request_settled(self, request: Request) -> None:
+        if (stats := self.request_stats.pop(request, None)) is None:
+            return
+        stats.requests_pending -= 1
+        self._report(stats)
@@ -1,8 +1,9 @@
 import asyncio
 import logging
 from . import database as db
+from .browsing import LEAN_MODE, WorkerPage
 from collections.abc import AsyncIterator
-from playwright.async_api import async_playwright, Page
+from playwright.async_api import async_playwright
 from sqlalchemy.orm import Session
 from urllib.parse import urljoin
 
@@ -19,9 +20,9 @@ class ManufacturersJob:
     def __init__(self, target_href: str):
         self.target_href = target_href
 
-    async def scrape_target(self, *, page: Page, session: Session) -> AsyncIterator:
+    async def scrape_target(self, *, worker_page: WorkerPage, session: Session) -> AsyncIterator:
         logging.info("Starting manufacturer scraping. This will take up to an hour...")
-        await page.goto(self.target_href)
+        page = await worker_page.goto(self.target_href)
         base_href = await page.locator("head base").first.get_attribute("href") or ""
         manufacturers = await page.locator(".allmakes li a").all()
         logging.info(f"Found {len(manufacturers)} manufacturers")
@@ -42,8 +43,8 @@ class CategoriesJob:
         self.manufacturer_id = manufacturer_id
         self.target_href = target_href
 
-    async def scrape_target(self, *, page: Page, session: Session) -> AsyncIterator:
-        await page.goto(self.target_href)
+    async def scrape_target(self, *, worker_page: WorkerPage, session: Session) -> AsyncIterator:
+        page = await worker_page.goto(self.target_href)
         base_href = await page.locator("head base").first.get_attribute("href") or ""
         for category in await page.locator(".allcategories li a").all():
             name, href = (await category.text_content()).strip(), (await category.get_attribute("href")).strip()
@@ -61,8 +62,8 @@ class ModelsJob:
         self.category_id = category_id
         self.target_href = target_href
 
-    async def scrape_target(self, *, page: Page, session: Session) -> AsyncIterator:
-        await page.goto(self.target_href)
+    async def scrape_target(self, *, worker_page: WorkerPage, session: Session) -> AsyncIterator:
+        page = await worker_page.goto(self.target_href)
         base_href = await page.locator("head base").first.get_attribute("href") or ""
         for model in await page.locator(".allmodels li a").all():
             name, href = (await model.text_content()).strip(), (await model.get_attribute("href")).strip()
@@ -80,9 +81,9 @@ class PartsJob:
         self.model_id = model_id
         self.target_href = target_href
 
-    async def scrape_target(self, *, page: Page, session: Session) -> AsyncIterator:
+    async def scrape_target(self, *, worker_page: WorkerPage, session: Session) -> AsyncIterator:
         global parts_scraped
-        await page.goto(self.target_href)
+        page = await worker_page.goto(self.target_href)
         for part in await page.locator(".allparts li a").all():
             if (name := await part.text_content()) is not None:
                 elements = name.split("-", 1)
@@ -101,11 +102,17 @@ class PartsJob:
             yield  # TODO: Is there a better to way to force an "empty" AsyncIterator?!?
 
 
-async def scraping_worker(*, scraper_queue: asyncio.Queue, page: Page, session: Session) -> None:
+async def scraping_worker(*, scraper_queue: asyncio.Queue, worker_page: WorkerPage, session: Session) -> None:
     while True:
         job = await scraper_queue.get()
-        async for followup_job in job.scrape_target(page=page, session=session):
-            await scraper_queue.put(followup_job)
+        try:
+            await worker_page.acquire(job.target_href)
+            async for followup_job in job.scrape_target(worker_page=worker_page, session=session):
+                await scraper_queue.put(followup_job)
+        except BaseException:
+            await worker_page.close()
+            raise
+        await worker_page.release()
         scraper_queue.task_done()
 
 
@@ -118,16 +125,28 @@ async def main():
     async with async_playwright() as playwright:
         chromium = await playwright.chromium.launch(headless=True)
 
+        worker_pages = []
         for _ in range(1):  # Limiting to one to work well with Docker environment.
+            worker_pages.append(worker_page := WorkerPage(chromium))
             asyncio.create_task(
                 scraping_worker(
                     scraper_queue=scraper_queue,
-                    page=await chromium.new_page(),
+                    worker_page=worker_page,
                     session=db.SessionLocal(),
                 )
             )
         await scraper_queue.join()
 
+        for worker_page in worker_pages:
+            await worker_page.close()
+        received = sum(worker_page.bytes_received for worker_page in worker_pages)
+        blocked = sum(worker_page.requests_blocked for worker_page in worker_pages)
+        load_seconds = sum(worker_page.load_seconds for worker_page in worker_pages)
+        logging.info(
+            f"{'Lean' if LEAN_MODE else 'Full'} mode: {received / 2**20:.1f} MiB received, "
+            f"{blocked} requests blocked, {load_seconds:.0f}s spent loading pages in total"
+        )
+
         await chromium.close()
 
     logging.info(f"Scraping completed successfully! Total parts scraped: {parts_scraped}")
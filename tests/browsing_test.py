@@ -0,0 +1,81 @@
+import asyncio
+import pytest
+from catalogue import browsing
+from catalogue.browsing import PageStats, WorkerPage, chromium_pss_mb
+from pathlib import Path
+
+
+class FakeRequest:
+    def __init__(self, body_size: int):
+        self.body_size = body_size
+
+    async def sizes(self) -> dict:
+        return {"responseHeadersSize": 100, "responseBodySize": self.body_size}
+
+
+def write_process(proc_dir: Path, pid: int, ppid: int, pss_kb: int | None = None) -> None:
+    (proc_dir / str(pid)).mkdir()
+    (proc_dir / str(pid) / "stat").write_text(f"{pid} (chrome (renderer)) S {ppid} 1 1 0")
+    if pss_kb is not None:
+        (proc_dir / str(pid) / "smaps_rollup").write_text(f"Rss: {pss_kb * 2} kB\nPss: {pss_kb} kB\nPss_Anon: 1 kB\n")
+
+
+@pytest.fixture
+def worker_page() -> WorkerPage:
+    return WorkerPage(browser=None)
+
+
+def test_chromium_pss_mb_counts_chromium_processes_only(tmp_path: Path) -> None:
+    write_process(tmp_path, 100, 1, pss_kb=50_000)  # The scraper itself.
+    write_process(tmp_path, 200, 100, pss_kb=40_000)  # The Playwright driver.
+    write_process(tmp_path, 300, 200, pss_kb=1024)  # The Chromium browser process.
+    write_process(tmp_path, 301, 300, pss_kb=2048)  # A renderer.
+    write_process(tmp_path, 302, 300)  # Exited before its memory could be read.
+    write_process(tmp_path, 400, 1, pss_kb=99_000)  # Unrelated.
+    (tmp_path / "self").mkdir()
+
+    assert chromium_pss_mb(str(tmp_path), root_pid=100) == 3
+
+
+def test_chromium_pss_mb_without_proc(tmp_path: Path) -> None:
+    assert chromium_pss_mb(str(tmp_path / "missing"), root_pid=100) is None
+
+
+@pytest.mark.parametrize(
+    ("pages_visited", "pss_mb", "recycles"),
+    [
+        (browsing.RECYCLE_AFTER_PAGES, None, True),
+        (browsing.MIN_PAGES_BETWEEN_RECYCLES - 1, browsing.RECYCLE_ABOVE_PSS_MB + 1, False),
+        (browsing.MIN_PAGES_BETWEEN_RECYCLES, browsing.RECYCLE_ABOVE_PSS_MB + 1, True),
+        (browsing.MIN_PAGES_BETWEEN_RECYCLES, browsing.RECYCLE_ABOVE_PSS_MB, False),
+        (browsing.MIN_PAGES_BETWEEN_RECYCLES, None, False),
+    ],
+)
+def test_recycle_reason(
+    worker_page: WorkerPage, monkeypatch: pytest.MonkeyPatch, pages_visited: int, pss_mb: float | None, recycles: bool
+) -> None:
+    monkeypatch.setattr(browsing, "chromium_pss_mb", lambda: pss_mb)
+    worker_page.pages_visited = pages_visited
+    assert (worker_page.recycle_reason() is not None) == recycles
+
+
+def test_requests_are_attributed_to_the_page_that_started_them(worker_page: WorkerPage) -> None:
+    first, second = PageStats("https://example.com/first"), PageStats("https://example.com/second")
+    late, failed, current = FakeRequest(1000), FakeRequest(0), FakeRequest(500)
+
+    worker_page.stats = first
+    worker_page._request_started(late)
+    worker_page._request_started(failed)
+    first.released = True
+
+    worker_page.stats = second
+    worker_page._request_started(current)
+    asyncio.run(worker_page._request_finished(current))
+    asyncio.run(worker_page._request_finished(late))
+    assert (first.bytes_received, second.bytes_received) == (1100, 600)
+    assert not first.reported
+
+    worker_page._request_failed(failed)
+    assert first.reported and not second.reported
+    assert worker_page.bytes_received == 1100
+    assert worker_page.request_stats == {}